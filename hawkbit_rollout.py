@@ -11,21 +11,117 @@ Hawkbit Config-Driven Rollout Script
 """
 
 import os
+import io
+import sys
 import csv
 import time
-import json
-import requests
+import types
+import random
+import logging
+import orjson
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 CONFIG_FILE = "config.json"
 CSV_FILE = "target_rollout.csv"
 FILTER_NAME = "Target_filter"
 ROLLOUT_PREFIX = "Rollout_Seq"
+API_ROOT = "/rest/v1"
+
+log = logging.getLogger(__name__)
+
+MAX_CONNECTIONS = 32
+MAX_WORKERS = 16  # must not exceed MAX_CONNECTIONS
+HTTP_TIMEOUT = 30
+BULK_BATCH_SIZE = 100  # Hawkbit caps page size at 500
+MISSING_SHOWN = 20
+BACKOFF_CAP_FACTOR = 4  # idle polls wait at most interval * (1 + factor)
+READY_ATTEMPTS = 24  # ~103s of sleeps before jitter, close to the old 20 x 5s
+READY_MIN_DELAY = 0.25
+READY_MAX_DELAY = 5.0
+PROGRESS_FIELDS = "status,totalTargets,totalTargetsCompleted,totalTargetsFailed,totalTargetsPending"
+
+# OS-seeded so concurrently running scripts do not poll in lockstep
+_rng = random.SystemRandom()
+
+# Distribution set IDs keyed by (base_url, name, version)
+_ds_cache = {}
+
+# ----------------------------------------------------------------------
+# Class: HawkbitCfg
+# Purpose:
+#     Validated, read-only view of config.json.
+# Created by:  Adi Gudiseva
+# Date:        10.14.2026
+# ----------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class HawkbitCfg:
+    url: str
+    user: str
+    pw: str
+    poll_interval: float
+    poll_timeout: float
+    sequences: dict
+
+    def __post_init__(self):
+        for key, value in (("hawkbit.url", self.url), ("hawkbit.username", self.user),
+                           ("hawkbit.password", self.pw)):
+            if not isinstance(value, str):
+                raise RuntimeError(f"Invalid config: '{key}' must be a string, got {value!r}")
+        for key, value in (("polling.interval", self.poll_interval),
+                           ("polling.timeout", self.poll_timeout)):
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+                raise RuntimeError(f"Invalid config: '{key}' must be a positive number, got {value!r}")
+        if not isinstance(self.sequences, dict):
+            raise RuntimeError(f"Invalid config: 'sequences' must be an object, got {type(self.sequences).__name__}")
+        # Catch bad entries now, not after the filter and earlier
+        # rollouts already exist on the server
+        for seq, entries in self.sequences.items():
+            if not isinstance(entries, list):
+                raise RuntimeError(f"Invalid config: 'sequences.{seq}' must be a list, got {type(entries).__name__}")
+            for i, ds in enumerate(entries):
+                if not isinstance(ds, dict):
+                    raise RuntimeError(f"Invalid config: 'sequences.{seq}[{i}]' must be an object, got {ds!r}")
+                for key in ("name", "version"):
+                    if not isinstance(ds.get(key), str):
+                        raise RuntimeError(f"Invalid config: 'sequences.{seq}[{i}].{key}' must be a string, got {ds.get(key)!r}")
+
+
+# ----------------------------------------------------------------------
+# Method: _flatten()
+# Purpose:
+#     Map the nested config.json layout onto HawkbitCfg fields.
+# Parameters:
+#     raw - Parsed config.json contents
+# Created by:  Adi Gudiseva
+# Date:        10.14.2026
+# ----------------------------------------------------------------------
+def _flatten(raw):
+    if not isinstance(raw, dict):
+        raise RuntimeError("Invalid config: top level must be an object")
+    for section in ("hawkbit", "polling"):
+        if section in raw and not isinstance(raw[section], dict):
+            raise RuntimeError(f"Invalid config: '{section}' must be an object")
+    try:
+        return {
+            "url": raw["hawkbit"]["url"],
+            "user": raw["hawkbit"]["username"],
+            "pw": raw["hawkbit"]["password"],
+            "poll_interval": raw["polling"]["interval"],
+            "poll_timeout": raw["polling"]["timeout"],
+            "sequences": raw["sequences"],
+        }
+    except KeyError as e:
+        raise RuntimeError(f"Invalid config, missing key: {e}") from None
+
 
 # ----------------------------------------------------------------------
 # Method: load_config()
 # Purpose:
-#     Load the Hawkbit rollout configuration from a JSON file.
+#     Load and validate the Hawkbit rollout configuration from a
+#     JSON file.
 # Parameters:
 #     path - Path to configuration file
 # Created by:  Adi Gudiseva
@@ -34,15 +130,14 @@ ROLLOUT_PREFIX = "Rollout_Seq"
 def load_config(path):
     if not Path(path).exists():
         raise FileNotFoundError(f"Config file not found: {path}")
-    with open(path, "r") as f:
-        cfg = json.load(f)
-    return cfg
+    return HawkbitCfg(**_flatten(orjson.loads(Path(path).read_bytes())))
 
 
 # ----------------------------------------------------------------------
 # Method: init_session()
 # Purpose:
-#     Initialize a persistent HTTP session for Hawkbit API calls.
+#     Initialize a persistent HTTP/2 session for Hawkbit API calls.
+#     Request paths are relative to the Hawkbit server URL.
 # Parameters:
 #     url - Hawkbit server URL
 #     user - Username
@@ -51,16 +146,61 @@ def load_config(path):
 # Date:        10.23.2025
 # ----------------------------------------------------------------------
 def init_session(url, user, pw):
-    s = requests.Session()
-    s.auth = (user, pw)
-    s.headers.update({
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    })
-    s.base_url = url
+    # HTTP/2 multiplexes concurrent requests over one keep-alive connection
+    s = httpx.Client(
+        http2=True,
+        base_url=url,
+        auth=(user, pw),
+        headers={
+            "Accept": "application/json",
+            "Content-Type": "application/json"
+        },
+        limits=httpx.Limits(max_connections=MAX_CONNECTIONS,
+                            max_keepalive_connections=MAX_CONNECTIONS),
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True
+    )
+    # Hawkbit REST endpoints, relative to base_url
+    s.urls = types.SimpleNamespace(
+        distributionsets=f"{API_ROOT}/distributionsets",
+        targetfilters=f"{API_ROOT}/targetfilters",
+        rollouts=f"{API_ROOT}/rollouts",
+        targets=f"{API_ROOT}/targets",
+        rollout=lambda rid: f"{API_ROOT}/rollouts/{rid}",
+        target=lambda tid: f"{API_ROOT}/targets/{tid}"
+    )
     return s
 
 
+# ----------------------------------------------------------------------
+# Method: _json()
+# Purpose:
+#     Decode a Hawkbit JSON response body with orjson.
+# Parameters:
+#     r - HTTP response
+# Created by:  Adi Gudiseva
+# Date:        10.14.2026
+# ----------------------------------------------------------------------
+def _json(r):
+    return orjson.loads(r.content)
+
+
+# ----------------------------------------------------------------------
+# Method: next_delay()
+# Purpose:
+#     Compute a polling delay: never less than the base interval, plus
+#     a random extra that grows exponentially while nothing changes.
+# Parameters:
+#     attempt - Number of consecutive polls without progress
+#     base - Minimum delay in seconds (the configured interval)
+#     cap - Maximum extra delay in seconds on top of base
+# Created by:  Adi Gudiseva
+# Date:        10.14.2026
+# ----------------------------------------------------------------------
+def next_delay(attempt, base, cap):
+    return base + _rng.uniform(0, min(cap, base * 2 ** attempt))
+
+
 # ----------------------------------------------------------------------
 # Method: get_distribution_set()
 # Purpose:
@@ -73,17 +213,27 @@ def init_session(url, user, pw):
 # Date:        10.23.2025
 # ----------------------------------------------------------------------
 def get_distribution_set(session, name, version):
-    url = f"{session.base_url}/rest/v1/distributionsets?name=={name};version=={version}"
-    r = session.get(url)
+    key = (str(session.base_url), name, version)
+    if key in _ds_cache:
+        print(f"Found distribution set: {name} ({version}) → ID={_ds_cache[key]} (cached)")
+        return _ds_cache[key]
+
+    url = f"{session.urls.distributionsets}?name=={name};version=={version}"
+    try:
+        r = session.get(url)
+    except httpx.TransportError as e:
+        print(f"Failed to query distribution set: {e!r}")
+        return None
     if r.status_code != 200:
         print(f"Failed to query distribution set: HTTP {r.status_code}")
         return None
 
-    data = r.json()
+    data = _json(r)
     sets = data.get("content") or data.get("_embedded", {}).get("distributionsets", [])
     for ds in sets:
         if ds.get("name") == name and ds.get("version") == version:
             print(f"Found distribution set: {name} ({version}) → ID={ds.get('id')}")
+            _ds_cache[key] = ds.get("id")
             return ds.get("id")
 
     print(f"Distribution set '{name}' ({version}) not found (exact match).")
@@ -91,26 +241,87 @@ def get_distribution_set(session, name, version):
 
 
 # ----------------------------------------------------------------------
-# Method: generate_or_query()
+# Method: prefetch_distribution_sets()
 # Purpose:
-#     Build an RSQL query string from a CSV file of serial numbers.
+#     Load the distribution set IDs a sequence needs in one request so
+#     later get_distribution_set() lookups are served from the cache.
+#     Best-effort: on any failure the lookups simply query one by one.
+# Parameters:
+#     session - Active Hawkbit session
+#     sequence - List of {"name", "version"} entries from config.json
+#     limit - Maximum number of distribution sets to fetch
+# Created by:  Adi Gudiseva
+# Date:        10.14.2026
+# ----------------------------------------------------------------------
+def prefetch_distribution_sets(session, sequence, limit=500):
+    wanted = {(ds["name"], ds["version"]) for ds in sequence}
+    # A single lookup is cheaper on its own than a prefetch
+    if len(wanted) < 2:
+        return 0
+
+    url = session.urls.distributionsets
+    quoted = ",".join(f'"{name}"' for name in sorted({name for name, _ in wanted}))
+    try:
+        r = session.get(url, params={"q": f"name=in=({quoted})", "limit": limit})
+    except httpx.TransportError as e:
+        print(f"Failed to prefetch distribution sets: {e!r}")
+        return 0
+    if r.status_code != 200:
+        print(f"Failed to prefetch distribution sets: HTTP {r.status_code}")
+        return 0
+
+    data = _json(r)
+    sets = data.get("content") or data.get("_embedded", {}).get("distributionsets", [])
+    count = 0
+    for ds in sets:
+        key = (ds.get("name"), ds.get("version"))
+        if key in wanted:
+            _ds_cache[(str(session.base_url), *key)] = ds.get("id")
+            count += 1
+    return count
+
+
+# ----------------------------------------------------------------------
+# Method: iter_serials()
+# Purpose:
+#     Stream non-empty serial numbers from a CSV file.
 # Parameters:
 #     csv_file - Path to CSV file containing serial numbers
 # Created by:  Adi Gudiseva
-# Date:        10.23.2025
+# Date:        10.14.2026
 # ----------------------------------------------------------------------
-def generate_or_query(csv_file):
-    serials = []
+def iter_serials(csv_file):
     with open(csv_file, newline="") as f:
-        reader = csv.reader(f)
-        for row in reader:
+        for row in csv.reader(f):
             for val in row:
                 val = val.strip()
                 if val:
-                    serials.append(val)
+                    yield val
+
+
+# ----------------------------------------------------------------------
+# Method: generate_target_query()
+# Purpose:
+#     Build an RSQL "name=in=(...)" target query from a CSV file of
+#     serial numbers. Returns the query and the serials as a tuple.
+# Parameters:
+#     csv_file - Path to CSV file containing serial numbers
+# Created by:  Adi Gudiseva
+# Date:        10.23.2025
+# ----------------------------------------------------------------------
+def generate_target_query(csv_file):
+    buf = io.StringIO()
+    buf.write("name=in=(")
+    serials = []
+    for s in iter_serials(csv_file):
+        if serials:
+            buf.write(",")
+        buf.write(f'"{s}"')
+        serials.append(s)
     if not serials:
         raise RuntimeError("CSV empty or unreadable.")
-    return "(" + " or ".join([f'name==\"{s}\"' for s in serials]) + ")", serials
+    buf.write(")")
+    return buf.getvalue(), tuple(serials)
 
 
 # ----------------------------------------------------------------------
@@ -125,31 +336,37 @@ def generate_or_query(csv_file):
 # Date:        10.23.2025
 # ----------------------------------------------------------------------
 def create_target_filter(session, name, query):
-    url = f"{session.base_url}/rest/v1/targetfilters"
+    url = session.urls.targetfilters
     payload = {"name": name, "query": query}
 
-    r = session.post(url, json=payload)
-    if r.status_code in (200, 201):
-        print(f"Filter '{name}' created.")
-        return True
-    elif r.status_code == 409:
-        print(f"Filter '{name}' exists, updating...")
-        resp = session.get(url)
-        data = resp.json()
-        filters = data.get("content") or data.get("_embedded", {}).get("targetfilters", [])
-        fid = next((f.get("id") for f in filters if f.get("name") == name), None)
-        if fid:
-            u = session.put(f"{url}/{fid}", json=payload)
-            if u.status_code in (200, 204):
-                print("Updated existing filter.")
-                return True
+    try:
+        r = session.post(url, json=payload)
+        if r.status_code in (200, 201):
+            print(f"Filter '{name}' created.")
+            return True
+        elif r.status_code == 409:
+            print(f"Filter '{name}' exists, updating...")
+            # Let the server match the name rather than listing every filter
+            resp = session.get(url, params={"q": f'name=="{name}"', "limit": 1})
+            data = _json(resp)
+            filters = data.get("content") or data.get("_embedded", {}).get("targetfilters", [])
+            fid = filters[0].get("id") if filters and filters[0].get("name") == name else None
+            if fid:
+                u = session.put(f"{url}/{fid}", json=payload)
+                if u.status_code in (200, 204):
+                    print("Updated existing filter.")
+                    return True
+                else:
+                    print(f"Update failed {u.status_code}: {u.text}")
             else:
-                print(f"Update failed {u.status_code}: {u.text}")
+                print("Filter ID not found during update.")
+            return False
         else:
-            print("Filter ID not found during update.")
-        return False
-    else:
-        print(f"Filter creation failed: HTTP {r.status_code} → {r.text}")
+            print(f"Filter creation failed: HTTP {r.status_code} → {r.text}")
+            return False
+    except httpx.TransportError as e:
+        # The write may still have reached the server
+        print(f"Filter step failed: {e!r}")
         return False
 
 
@@ -168,7 +385,7 @@ def create_target_filter(session, name, query):
 # Date:        10.23.2025
 # ----------------------------------------------------------------------
 def create_rollout(session, name, query, ds_id, group_size, action_type):
-    url = f"{session.base_url}/rest/v1/rollouts"
+    url = session.urls.rollouts
     payload = {
         "name": name,
         "distributionSetId": ds_id,
@@ -177,11 +394,15 @@ def create_rollout(session, name, query, ds_id, group_size, action_type):
         "amountGroups": group_size,
         "start": "auto"
     }
-    print("Payload:", json.dumps(payload, indent=2))
-    r = session.post(url, json=payload)
+    print("Payload:", orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
+    try:
+        r = session.post(url, json=payload)
+    except httpx.TransportError as e:
+        print(f"Rollout creation failed: {e!r} — it may still exist on the server as '{name}'.")
+        return None
 
     if r.status_code in (200, 201):
-        data = r.json()
+        data = _json(r)
         rid = data.get("id")
         print(f"Rollout '{name}' created (ID={rid}).")
         return rid
@@ -206,21 +427,36 @@ def create_rollout(session, name, query, ds_id, group_size, action_type):
 def start_rollout(session, rollout_id):
     if not rollout_id:
         return
-    rollout_url = f"{session.base_url}/rest/v1/rollouts/{rollout_id}"
-    for attempt in range(20):
-        r = session.get(rollout_url)
-        if r.status_code == 200:
-            state = r.json().get("status")
-            print(f"Rollout status: {state}")
+    rollout_url = session.urls.rollout(rollout_id)
+    # Rollouts usually turn ready within a second or two, so probe
+    # early and often, then back off towards READY_MAX_DELAY
+    delay = READY_MIN_DELAY
+    last_state = None
+    for _ in range(READY_ATTEMPTS):
+        try:
+            r = session.get(rollout_url, params={"fields": "status"})
+        except httpx.TransportError as e:
+            print(f"Error fetching rollout status: {e!r}")
+            r = None
+        if r is not None and r.status_code == 200:
+            state = _json(r).get("status")
+            if state != last_state:
+                print(f"Rollout status: {state}")
+                last_state = state
             if state == "ready":
                 break
-        time.sleep(5)
+        time.sleep(delay + _rng.uniform(0, delay * 0.2))
+        delay = min(delay * 2, READY_MAX_DELAY)
     else:
         print("Timeout waiting for rollout to become ready.")
         return
 
     start_url = f"{rollout_url}/start"
-    r = session.post(start_url)
+    try:
+        r = session.post(start_url)
+    except httpx.TransportError as e:
+        print(f"Failed to start rollout: {e!r}")
+        return
     if r.status_code in (200, 202):
         print(f"Rollout ID {rollout_id} started successfully.")
     else:
@@ -240,38 +476,99 @@ def start_rollout(session, rollout_id):
 # Date:        10.23.2025
 # ----------------------------------------------------------------------
 def monitor_rollout_until_done(session, rollout_id, interval=10, timeout=1800):
-    print("\nMonitoring rollout progress (Ctrl+C to stop)...\n")
-    rollout_url = f"{session.base_url}/rest/v1/rollouts/{rollout_id}"
-    start_time = time.time()
-
-    try:
-        while True:
-            r = session.get(rollout_url)
-            if r.status_code != 200:
-                print(f"Failed to fetch progress: {r.status_code}")
-                time.sleep(interval)
-                continue
-
-            data = r.json()
+    log.info("Monitoring rollout %s progress (Ctrl+C to stop)...", rollout_id)
+    rollout_url = session.urls.rollout(rollout_id)
+    deadline = time.time() + timeout
+    attempt = 0
+    progress = None
+    last = None
+    params = {"fields": PROGRESS_FIELDS}
+    etag = None
+    cap = interval * BACKOFF_CAP_FACTOR
+
+    while True:
+        headers = {"If-None-Match": etag} if etag else None
+        try:
+            r = session.get(rollout_url, params=params, headers=headers)
+        except httpx.TransportError as e:
+            r = None
+            error = repr(e)
+
+        if r is not None and r.status_code == 304:
+            # Unchanged since the last poll, nothing to decode
+            attempt += 1
+        elif r is None or r.status_code != 200:
+            if r is not None:
+                error = r.status_code
+            log.warning("Rollout %s: failed to fetch progress: %s", rollout_id, error)
+            attempt += 1
+        else:
+            etag = r.headers.get("ETag")
+            data = _json(r)
             status = data.get("status")
             total = data.get("totalTargets", 0)
             done = data.get("totalTargetsCompleted", 0)
             failed = data.get("totalTargetsFailed", 0)
             pending = data.get("totalTargetsPending", 0)
-            print(f"Status: {status} | Completed: {done} | Failed: {failed} | Pending: {pending} | Total: {total}")
+            # Only log polls that change the rollout state
+            if (status, done, failed, pending) != last:
+                last = (status, done, failed, pending)
+                log.info("Rollout %s | Status: %s | Completed: %s | Failed: %s | Pending: %s | Total: %s",
+                         rollout_id, status, done, failed, pending, total)
 
             if status in ["finished", "error", "paused"]:
-                print(f"\nRollout ended with status: {status.upper()}")
+                log.info("Rollout %s ended with status: %s", rollout_id, status.upper())
                 break
 
-            if time.time() - start_time > timeout:
-                print("Timeout reached. Stopping monitoring.")
-                break
+            # Poll at the base interval after progress, back off while idle
+            if (status, done, failed) != progress:
+                progress = (status, done, failed)
+                attempt = 0
+            else:
+                attempt += 1
 
-            time.sleep(interval)
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            log.warning("Rollout %s: timeout reached. Stopping monitoring.", rollout_id)
+            break
+        # Never sleep past the deadline, so the last poll lands on it
+        time.sleep(min(next_delay(attempt, interval, cap), remaining))
 
-    except KeyboardInterrupt:
-        print("\nMonitoring stopped by user.")
+
+# ----------------------------------------------------------------------
+# Method: bulk_target_status()
+# Purpose:
+#     Fetch all targets for the given serial numbers with RSQL
+#     "name=in=(...)" queries of BULK_BATCH_SIZE serials each, keyed
+#     by target name. Returns None if any batch fails.
+# Parameters:
+#     session - Active Hawkbit session
+#     serials - List of target serial numbers
+# Created by:  Adi Gudiseva
+# Date:        10.14.2026
+# ----------------------------------------------------------------------
+def bulk_target_status(session, serials):
+    url = session.urls.targets
+    found = {}
+    # Batches keep each page under Hawkbit's page-size cap and the
+    # query string within URL length limits
+    for i in range(0, len(serials), BULK_BATCH_SIZE):
+        batch = serials[i:i + BULK_BATCH_SIZE]
+        quoted = ",".join(f'"{s}"' for s in batch)
+        params = {"q": f"name=in=({quoted})", "limit": len(batch)}
+        try:
+            r = session.get(url, params=params)
+        except httpx.TransportError as e:
+            print(f"Failed to query targets: {e!r}")
+            return None
+        if r.status_code != 200:
+            print(f"Failed to query targets: HTTP {r.status_code}")
+            return None
+
+        data = _json(r)
+        targets = data.get("content") or data.get("_embedded", {}).get("targets", [])
+        found.update((t.get("name"), t) for t in targets)
+    return found
 
 
 # ----------------------------------------------------------------------
@@ -281,14 +578,18 @@ def monitor_rollout_until_done(session, rollout_id, interval=10, timeout=1800):
 # Parameters:
 #     session - Active Hawkbit session
 #     target_id - Target ID
+#     r - Optional response (or transport error) from fetch_all()
 # Created by:  Adi Gudiseva
 # Date:        10.23.2025
 # ----------------------------------------------------------------------
-def get_assigned_ds(session, target_id):
-    url = f"{session.base_url}/rest/v1/targets/{target_id}/assignedDS"
-    r = session.get(url)
+def get_assigned_ds(session, target_id, r=None):
+    if r is None:
+        r = session.get(f"{session.urls.target(target_id)}/assignedDS")
+    if isinstance(r, httpx.TransportError):
+        print(f"Error fetching assigned DS: {r!r}")
+        return False
     if r.status_code == 200:
-        ds = r.json()
+        ds = _json(r)
         print(f"Assigned: {ds.get('name')} ({ds.get('version')})")
         return True
     elif r.status_code == 204:
@@ -306,14 +607,18 @@ def get_assigned_ds(session, target_id):
 # Parameters:
 #     session - Active Hawkbit session
 #     target_id - Target ID
+#     r - Optional response (or transport error) from fetch_all()
 # Created by:  Adi Gudiseva
 # Date:        10.23.2025
 # ----------------------------------------------------------------------
-def get_installed_ds(session, target_id):
-    url = f"{session.base_url}/rest/v1/targets/{target_id}/installedDS"
-    r = session.get(url)
+def get_installed_ds(session, target_id, r=None):
+    if r is None:
+        r = session.get(f"{session.urls.target(target_id)}/installedDS")
+    if isinstance(r, httpx.TransportError):
+        print(f"Error fetching installed DS: {r!r}")
+        return False
     if r.status_code == 200:
-        ds = r.json()
+        ds = _json(r)
         print(f"Installed: {ds.get('name')} ({ds.get('version')})")
         return True
     elif r.status_code == 204:
@@ -332,18 +637,23 @@ def get_installed_ds(session, target_id):
 # Parameters:
 #     session - Active Hawkbit session
 #     target_id - Target ID (serial number)
+#     r - Optional response (or transport error) from fetch_all()
 # Created by:  Adi Gudiseva
 # Date:        10.24.2025
 # ----------------------------------------------------------------------
-def get_firmware_history(session, target_id):
-    url = f"{session.base_url}/rest/v1/targets/{target_id}/actions"
-    r = session.get(url)
+def get_firmware_history(session, target_id, r=None):
+    if r is None:
+        r = session.get(f"{session.urls.target(target_id)}/actions")
+
+    if isinstance(r, httpx.TransportError):
+        print(f"Error fetching firmware history: {r!r}")
+        return
 
     if r.status_code != 200:
         print(f"Error fetching firmware history: HTTP {r.status_code}")
         return
 
-    actions = r.json().get("content", [])
+    actions = _json(r).get("content", [])
     if not actions:
         print("No firmware history found.")
         return
@@ -370,6 +680,32 @@ def get_firmware_history(session, target_id):
 
     print("-" * 50)
 
+# ----------------------------------------------------------------------
+# Method: fetch_all()
+# Purpose:
+#     Fetch the assigned DS, installed DS and (optionally) action
+#     history responses for a target without printing, so it can be
+#     run from worker threads. Transport errors (e.g. timeouts) are
+#     returned in place of the failed response, so one slow request
+#     neither aborts the report nor hides the responses that did arrive.
+# Parameters:
+#     session - Active Hawkbit session
+#     target_id - Target ID (serial number)
+#     history - Also fetch the firmware history (actions)
+# Created by:  Adi Gudiseva
+# Date:        10.14.2026
+# ----------------------------------------------------------------------
+def fetch_all(session, target_id, history=False):
+    base = session.urls.target(target_id)
+
+    def get(path):
+        try:
+            return session.get(f"{base}/{path}")
+        except httpx.TransportError as e:
+            return e
+
+    return get("assignedDS"), get("installedDS"), get("actions") if history else None
+
 # ----------------------------------------------------------------------
 # Method: main()
 # Purpose:
@@ -380,32 +716,47 @@ def get_firmware_history(session, target_id):
 # Date:        10.23.2025
 # ----------------------------------------------------------------------
 def main():
+    logging.basicConfig(format="%(asctime)s %(message)s", stream=sys.stdout)
+    # INFO for this script only; httpx logs every request at INFO
+    log.setLevel(logging.INFO)
     config = load_config(CONFIG_FILE)
-    url = config["hawkbit"]["url"]
-    user = config["hawkbit"]["username"]
-    pw = config["hawkbit"]["password"]
-    session = init_session(url, user, pw)
-    poll_interval = config["polling"]["interval"]
-    poll_timeout = config["polling"]["timeout"]
+    session = init_session(config.url, config.user, config.pw)
 
     print("\nAvailable firmware sequences:")
-    for seq in config["sequences"]:
+    for seq in config.sequences:
         print(f"  - {seq}")
     seq_choice = input("\nEnter sequence version to deploy (e.g. 1.1): ").strip()
-    if seq_choice not in config["sequences"]:
-        print(f"Invalid sequence '{seq_choice}' — must be one of {list(config['sequences'].keys())}")
+    if seq_choice not in config.sequences:
+        print(f"Invalid sequence '{seq_choice}' — must be one of {list(config.sequences.keys())}")
         return
 
-    query, serials = generate_or_query(CSV_FILE)
+    query, serials = generate_target_query(CSV_FILE)
     serial_suffix = serials[0][-5:]  # last 5 chars of first serial
     print(f"\nUsing serial suffix for rollout naming: {serial_suffix}")
     print("Query:", query)
+
+    # Preflight: make sure the CSV targets exist before creating anything.
+    # bulk_target_status() returns None unless every batch was fetched,
+    # so a partial lookup never reports false "not found" targets.
+    statuses = bulk_target_status(session, serials)
+    if statuses is not None:
+        missing = [t for t in serials if t not in statuses]
+        if len(missing) == len(serials):
+            print("None of the CSV targets exist on the server, aborting.")
+            return
+        if missing:
+            shown = ", ".join(missing[:MISSING_SHOWN])
+            more = f" (+{len(missing) - MISSING_SHOWN} more)" if len(missing) > MISSING_SHOWN else ""
+            print(f"Warning: {len(missing)} target(s) not found on server: {shown}{more}")
+
     if not create_target_filter(session, FILTER_NAME, query):
         print("Target filter step failed, aborting.")
         return
 
-    for idx, ds in enumerate(config["sequences"][seq_choice], start=1):
-        print(f"\nStarting rollout {idx}/{len(config['sequences'][seq_choice])}: {ds['name']} ({ds['version']})")
+    sequence = config.sequences[seq_choice]
+    prefetch_distribution_sets(session, sequence)
+    for idx, ds in enumerate(sequence, start=1):
+        print(f"\nStarting rollout {idx}/{len(sequence)}: {ds['name']} ({ds['version']})")
         ds_id = get_distribution_set(session, ds["name"], ds["version"])
         if not ds_id:
             print("Skipping rollout — DS not found.")
@@ -413,18 +764,38 @@ def main():
 
         rollout_name = f"{ROLLOUT_PREFIX}_{seq_choice}_{serial_suffix}_{idx}"
         rollout_id = create_rollout(session, rollout_name, query, ds_id, 1, "forced")
+        # Rollouts share one target filter, so each must finish before
+        # the next assignment (which would cancel its open actions)
         if rollout_id:
             start_rollout(session, rollout_id)
-            monitor_rollout_until_done(session, rollout_id, poll_interval, poll_timeout)
+            try:
+                monitor_rollout_until_done(session, rollout_id, config.poll_interval, config.poll_timeout)
+            except KeyboardInterrupt:
+                print("\nMonitoring stopped by user.")
         else:
             print(f"Rollout '{rollout_name}' not created.")
 
     print("\nChecking target versions:\n")
+    if statuses is None:
+        statuses = {t: {} for t in serials}
+    ids = {t: info.get("controllerId", t) for t, info in statuses.items()}
+    found = [t for t in serials if t in ids]
+
+    # Fetch concurrently over the pooled session, print in order below
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        results = dict(ex.map(lambda t: (t, fetch_all(session, ids[t])), found))
+
     for target in serials:
         print(f"Target: {target}")
-        get_assigned_ds(session, target)
-        get_installed_ds(session, target)
-        #get_firmware_history(session, target)
+        if target not in results:
+            print("Target not found on server.")
+            print("-" * 50)
+            continue
+
+        assigned_r, installed_r, actions_r = results[target]
+        get_assigned_ds(session, ids[target], assigned_r)
+        get_installed_ds(session, ids[target], installed_r)
+        #get_firmware_history(session, ids[target], actions_r)
         print("-" * 50)
 
 